@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 
+import re
 import json
 import time
+import asyncio
 import random
 import logging
-from datetime import datetime, time as dt_time
+import threading
+from collections import Counter, deque
+from datetime import datetime, timedelta, time as dt_time
 from pathlib import Path
 from typing import List, Dict
-import schedule
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -30,9 +33,11 @@ from selenium.common.exceptions import (
 # ============================================================================
 
 SEND_TIME = "21:00"  # Daily execution time (24-hour format: HH:MM)
+HEARTBEAT_INTERVAL = 900  # Seconds between scheduler status updates
 COOKIES_FILE = "cookies.json"
 USERS_FILE = "list.txt"
 LOG_FILE = "tiktok_logs.txt"
+PROFILE_DIR = "chrome_profile"  # Persistent Chrome profiles (one per worker)
 
 STREAK_MESSAGES = [
     "text 1",
@@ -42,9 +47,33 @@ STREAK_MESSAGES = [
 
 MAX_RETRIES = 3
 WAIT_TIMEOUT = 20
-TYPING_DELAY_MIN = 0.05
-TYPING_DELAY_MAX = 0.15
-CAPTCHA_CHECK_ATTEMPTS = 3
+POLL_FREQUENCY = 0.25
+FALLBACK_TIMEOUT = 2  # Seconds granted to fallback selectors
+FALLBACK_POLL_FREQUENCY = 0.2
+SPA_NAV_TIMEOUT = 5  # Seconds to wait for in-app profile navigation before reloading
+MAX_FAIL_SHOTS = 2  # Debug screenshots saved per failure type per run
+CONCURRENT_WORKERS = 4
+# Profiles kept loading in background tabs per worker. Each preloaded tab is a
+# full page load, so in-app navigation (SPA_NAV_TIMEOUT) is only used when this is 1
+TABS_PER_WORKER = 3
+SESSION_COOKIE = "sessionid"
+
+# Media the bot never reads; dropped at the network layer
+BLOCKED_URL_PATTERNS = [
+    "*.mp4",
+    "*.webp",
+    "*.jpeg",
+    "*.jpg",
+    "*.png",
+    "*.woff",
+    "*.woff2",
+    "*tiktokcdn*/video/*",
+]
+CAPTCHA_WAIT_TIMEOUT = 3  # Seconds to wait for a closed captcha to disappear
+CAPTCHA_SELECTOR = "[class*='captcha'], [id*='captcha'], iframe[src*='captcha']"
+USERNAME_RE = re.compile(r'^\s*@?([A-Za-z0-9._]+)\s*$', re.MULTILINE)
+USER_LINE_RE = re.compile(r'^[ \t]*([^#\s].*?)\s*$', re.MULTILINE)  # Non-blank, non-comment lines
+CAPTCHA_RE = re.compile(r'drag the slider|verify you are human|puzzle|verification', re.IGNORECASE)
 
 
 # ============================================================================
@@ -85,8 +114,21 @@ def load_cookies() -> List[Dict]:
 
 def load_users() -> List[str]:
     try:
-        with open(USERS_FILE, 'r', encoding='utf-8') as f:
-            users = [line.strip().lstrip('@') for line in f if line.strip() and not line.startswith('#')]
+        data = Path(USERS_FILE).read_text(encoding='utf-8')
+        matches = USERNAME_RE.findall(data)
+        
+        # Only walk the lines one by one when some of them didn't parse
+        candidates = USER_LINE_RE.findall(data)
+        if len(candidates) != len(matches):
+            for line in candidates:
+                if not USERNAME_RE.fullmatch(line):
+                    logger.warning(f"⚠️ Skipping invalid line in {USERS_FILE}: {line!r}")
+        
+        # TikTok handles are case-insensitive; keep the first spelling of each
+        unique = {}
+        for username in matches:
+            unique.setdefault(username.lower(), username)
+        users = list(unique.values())
         logger.info(f"✓ Loaded {len(users)} users from {USERS_FILE}")
         return users
     except FileNotFoundError:
@@ -95,35 +137,30 @@ def load_users() -> List[str]:
 
 
 def log_activity(message: str, level: str = "INFO"):
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry = f"[{timestamp}] {level}: {message}"
-    
-    with open(LOG_FILE, 'a', encoding='utf-8') as f:
-        f.write(log_entry + '\n')
-    
-    if level == "ERROR":
-        logger.error(message)
-    elif level == "WARNING":
-        logger.warning(message)
-    else:
-        logger.info(message)
+    # The logger's FileHandler already writes LOG_FILE and keeps it open
+    getattr(logger, level.lower(), logger.info)(message)
 
 
 # ============================================================================
 # BROWSER SETUP
 # ============================================================================
 
-def setup_driver() -> webdriver.Chrome:
+def setup_driver(profile_dir: str = None) -> webdriver.Chrome:
     options = Options()
     
     logger.info("Setting up Chrome driver...")
     
+    if profile_dir:
+        options.add_argument(f'--user-data-dir={Path(profile_dir).resolve()}')
+    
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--disable-blink-features=AutomationControlled')
     options.add_argument('--disable-infobars')
     options.add_argument('--window-size=1920,1080')
     options.add_argument('--start-maximized')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_argument('--autoplay-policy=user-gesture-required')
     
     options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
     options.add_experimental_option('useAutomationExtension', False)
@@ -133,12 +170,23 @@ def setup_driver() -> webdriver.Chrome:
     prefs = {
         "profile.default_content_setting_values.notifications": 2,
         "credentials_enable_service": False,
-        "profile.password_manager_enabled": False
+        "profile.password_manager_enabled": False,
+        "profile.managed_default_content_settings.images": 2,
     }
     options.add_experimental_option("prefs", prefs)
     
+    # Return from driver.get at DOMContentLoaded; elements are waited for explicitly
+    options.page_load_strategy = 'eager'
+    
     driver = webdriver.Chrome(options=options)
+    configure_tab(driver)
     
+    logger.info("✓ Chrome driver initialized")
+    return driver
+
+
+def configure_tab(driver: webdriver.Chrome):
+    """Apply the stealth script and media blocking to the current tab (CDP settings are per tab)"""
     driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
         'source': '''
             Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
@@ -148,56 +196,96 @@ def setup_driver() -> webdriver.Chrome:
         '''
     })
     
-    logger.info("✓ Chrome driver initialized")
-    return driver
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
 
 
 def load_cookies_to_driver(driver: webdriver.Chrome, cookies: List[Dict]):
-    driver.get("https://www.tiktok.com")
-    time.sleep(2)
-    
+    # CDP accepts cookies before any navigation, so the first page load is authenticated
+    cdp_cookies = []
     for cookie in cookies:
-        try:
-            cookie_dict = {
-                'name': cookie.get('name'),
-                'value': cookie.get('value'),
-                'domain': cookie.get('domain', '.tiktok.com'),
-            }
-            
-            if 'path' in cookie:
-                cookie_dict['path'] = cookie['path']
-            if 'expirationDate' in cookie:
-                cookie_dict['expiry'] = int(cookie['expirationDate'])
-            if 'secure' in cookie:
-                cookie_dict['secure'] = cookie['secure']
-            if 'httpOnly' in cookie:
-                cookie_dict['httpOnly'] = cookie['httpOnly']
-            
-            driver.add_cookie(cookie_dict)
-        except Exception as e:
-            logger.warning(f"Failed to add cookie {cookie.get('name')}: {e}")
+        cookie_dict = {
+            'name': cookie.get('name'),
+            'value': cookie.get('value'),
+            'domain': cookie.get('domain', '.tiktok.com'),
+        }
+        
+        if 'path' in cookie:
+            cookie_dict['path'] = cookie['path']
+        if 'expirationDate' in cookie:
+            cookie_dict['expires'] = int(cookie['expirationDate'])
+        if 'secure' in cookie:
+            cookie_dict['secure'] = cookie['secure']
+        if 'httpOnly' in cookie:
+            cookie_dict['httpOnly'] = cookie['httpOnly']
+        
+        cdp_cookies.append(cookie_dict)
+    
+    try:
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': cdp_cookies})
+    except Exception as e:
+        # One bad cookie rejects the whole batch; retry individually
+        logger.warning(f"Batch cookie load failed ({e}), adding cookies one by one")
+        for cookie_dict in cdp_cookies:
+            try:
+                driver.execute_cdp_cmd('Network.setCookie', cookie_dict)
+            except Exception as e:
+                logger.warning(f"Failed to add cookie {cookie_dict['name']}: {e}")
     
     logger.info(f"✓ Cookies loaded")
 
 
+def is_driver_alive(driver: webdriver.Chrome) -> bool:
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+def has_session(driver: webdriver.Chrome, cookies: List[Dict]) -> bool:
+    """True if the profile already holds the session exported in cookies.json"""
+    expected = next((c.get('value') for c in cookies if c.get('name') == SESSION_COOKIE), None)
+    
+    # Read cookies over CDP so no navigation to tiktok.com is needed
+    profile_cookies = driver.execute_cdp_cmd('Network.getCookies', {'urls': ["https://www.tiktok.com"]})['cookies']
+    current = next((c.get('value') for c in profile_cookies if c.get('name') == SESSION_COOKIE), None)
+    
+    # A re-exported cookies.json replaces whatever session the profile kept
+    return current is not None and (expected is None or current == expected)
+
+
 def human_type(element, text):
-    for char in text:
-        element.send_keys(char)
-        time.sleep(random.uniform(TYPING_DELAY_MIN, TYPING_DELAY_MAX))
+    # One send_keys round-trip, with a randomized pause either side
+    time.sleep(random.uniform(0.2, 0.6))
+    element.send_keys(text)
+    time.sleep(random.uniform(0.2, 0.5))
 
 
 # ============================================================================
 # CAPTCHA HANDLING
 # ============================================================================
 
+def captcha_present(driver: webdriver.Chrome) -> bool:
+    # find_elements returns [] immediately when no captcha node exists
+    return bool(driver.find_elements(By.CSS_SELECTOR, CAPTCHA_SELECTOR))
+
+
+def wait_for_captcha_gone(driver: webdriver.Chrome):
+    try:
+        WebDriverWait(driver, CAPTCHA_WAIT_TIMEOUT, poll_frequency=POLL_FREQUENCY).until_not(captcha_present)
+    except TimeoutException:
+        logger.warning("⚠️ CAPTCHA still visible after closing")
+
+
 def check_and_close_captcha(driver: webdriver.Chrome) -> bool:
-    captcha_indicators = ["Drag the slider", "Verify you are human", "puzzle", "verification"]
-    
     try:
-        page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
-        captcha_found = any(indicator.lower() in page_text for indicator in captcha_indicators)
+        if not captcha_present(driver):
+            return False
+        
+        page_text = driver.find_element(By.TAG_NAME, "body").text
         
-        if captcha_found:
+        if CAPTCHA_RE.search(page_text):
             logger.warning("⚠️ CAPTCHA detected! Attempting to close...")
             
             close_selectors = [
@@ -208,20 +296,21 @@ def check_and_close_captcha(driver: webdriver.Chrome) -> bool:
             ]
             
             for selector in close_selectors:
-                try:
-                    close_btn = driver.find_element(By.XPATH, selector)
-                    if close_btn.is_displayed():
-                        close_btn.click()
-                        logger.info("✓ Closed captcha popup")
-                        time.sleep(2)
-                        return True
-                except:
-                    continue
+                # find_elements returns [] immediately when nothing matches
+                for close_btn in driver.find_elements(By.XPATH, selector):
+                    try:
+                        if close_btn.is_displayed():
+                            close_btn.click()
+                            logger.info("✓ Closed captcha popup")
+                            wait_for_captcha_gone(driver)
+                            return True
+                    except:
+                        continue
             
             try:
                 ActionChains(driver).send_keys(Keys.ESCAPE).perform()
                 logger.info("✓ Pressed ESC to close captcha")
-                time.sleep(2)
+                wait_for_captcha_gone(driver)
                 return True
             except:
                 pass
@@ -238,57 +327,50 @@ def check_and_close_captcha(driver: webdriver.Chrome) -> bool:
 def find_message_button(driver: webdriver.Chrome, wait: WebDriverWait) -> object:
     logger.info("🔍 Searching for Message button...")
     
-    # Priority selectors from inspect element
-    xpath_selectors = [
-        # EXACT from inspect element
-        "//button[@data-e2e='message-button']",
-        "//button[contains(@class, 'TUXButton') and @data-e2e='message-button']",
-        "//button[contains(@class, 'TUXButton--secondary') and @data-e2e='message-button']",
-        "//div[@class='TUXButton-label' and text()='Message']/ancestor::button",
-        
-        # Alternatives
-        "//button[@data-e2e='user-page-message-button']",
-        "//button[.//div[text()='Message']]",
-        "//button[contains(text(), 'Message')]",
-    ]
-    
-    for i, selector in enumerate(xpath_selectors, 1):
-        try:
-            logger.debug(f"  Trying selector #{i}...")
-            button = wait.until(EC.presence_of_element_located((By.XPATH, selector)))
-            
-            if button and button.is_displayed():
-                logger.info(f"✓ Found Message button (selector #{i})")
-                return button
-        except:
-            continue
+    primary_wait = wait
+    fallback_wait = WebDriverWait(driver, FALLBACK_TIMEOUT, poll_frequency=FALLBACK_POLL_FREQUENCY)
     
-    # CSS selectors
+    # Selectors from inspect element, OR-ed into one query
     css_selectors = [
         "button[data-e2e='message-button']",
+        "button[data-e2e='user-page-message-button']",
         "button.TUXButton[data-e2e='message-button']",
     ]
     
-    for selector in css_selectors:
-        try:
-            button = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-            if button and button.is_displayed():
-                logger.info(f"✓ Found Message button (CSS)")
-                return button
-        except:
-            continue
+    try:
+        button = primary_wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, ", ".join(css_selectors))))
+        logger.info("✓ Found Message button")
+        return button
+    except TimeoutException:
+        pass
+    
+    # Text-based fallback with a short, bounded timeout
+    text_xpath = "//button[.//div[text()='Message'] or contains(text(), 'Message')]"
+    try:
+        button = fallback_wait.until(EC.visibility_of_element_located((By.XPATH, text_xpath)))
+        logger.info("✓ Found Message button (text fallback)")
+        return button
+    except TimeoutException:
+        pass
     
     logger.error("❌ Message button not found")
     return None
 
 
+# Click method that last succeeded, keyed by driver session. When TikTok's modals
+# intercept the normal click, the next user skips straight to the method that
+# worked instead of paying for the failed attempts again.
+_last_click_strategy: Dict[str, str] = {}
+
+
 def click_message_button(driver: webdriver.Chrome, button) -> bool:
     if not button:
         return False
     
     logger.info("Clicking Message button...")
     
-    # Try multiple click methods
+    # Try multiple click methods. Native clicks go first because they raise when
+    # intercepted; a JavaScript click never does, so it is only a fallback
     methods = [
         ("Normal click", lambda: button.click()),
         ("Scroll + click", lambda: (driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button), time.sleep(0.5), button.click())),
@@ -296,12 +378,16 @@ def click_message_button(driver: webdriver.Chrome, button) -> bool:
         ("ActionChains", lambda: ActionChains(driver).move_to_element(button).click().perform()),
     ]
     
+    last_strategy = _last_click_strategy.get(driver.session_id)
+    if last_strategy:
+        methods.sort(key=lambda method: method[0] != last_strategy)
+    
     for method_name, method_func in methods:
         try:
             logger.debug(f"  Trying: {method_name}")
             method_func()
             logger.info(f"✓ Clicked via {method_name}")
-            time.sleep(2)
+            _last_click_strategy[driver.session_id] = method_name
             return True
         except Exception as e:
             logger.debug(f"  {method_name} failed: {type(e).__name__}")
@@ -311,11 +397,126 @@ def click_message_button(driver: webdriver.Chrome, button) -> bool:
     return False
 
 
+# ============================================================================
+# PROFILE NAVIGATION
+# ============================================================================
+
+def profile_title_matches(username: str):
+    """Wait condition: the profile header shows the given username"""
+    def condition(driver):
+        try:
+            titles = driver.find_elements(By.CSS_SELECTOR, "[data-e2e='user-title']")
+            return bool(titles) and titles[0].text.strip().lstrip('@').lower() == username.lower()
+        except StaleElementReferenceException:
+            return False
+    return condition
+
+
+# Drivers (by session id) where in-app navigation timed out this run
+_spa_nav_disabled = set()
+
+
+def open_profile(driver: webdriver.Chrome, wait: WebDriverWait, username: str, force_reload: bool = False):
+    profile_url = f"https://www.tiktok.com/@{username}"
+    
+    # Once the TikTok app is loaded, route client-side instead of reloading it.
+    # Retries always reload so they start from a clean page.
+    if (not force_reload
+            and driver.session_id not in _spa_nav_disabled
+            and driver.current_url.startswith("https://www.tiktok.com")):
+        logger.info(f"Routing in-app to {profile_url}")
+        driver.execute_script(
+            "window.history.pushState({}, '', arguments[0]);"
+            "window.dispatchEvent(new PopStateEvent('popstate'));",
+            f"/@{username}"
+        )
+        try:
+            WebDriverWait(driver, SPA_NAV_TIMEOUT, poll_frequency=POLL_FREQUENCY).until(profile_title_matches(username))
+            return
+        except TimeoutException:
+            # Don't pay SPA_NAV_TIMEOUT again for every user on this driver
+            _spa_nav_disabled.add(driver.session_id)
+            logger.warning("⚠️ In-app navigation not detected, using page reloads for the rest of the run")
+    
+    logger.info(f"Navigating to {profile_url}")
+    driver.get(profile_url)
+    wait_for_profile_header(wait)
+
+
+def wait_for_profile_header(wait: WebDriverWait):
+    # Wait for the profile header instead of a fixed sleep
+    try:
+        wait.until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, "[data-e2e='user-subtitle'], [data-e2e='user-avatar']")
+        ))
+    except TimeoutException:
+        logger.warning("⚠️ Profile header not detected, continuing...")
+
+
 # ============================================================================
 # SEND MESSAGE FUNCTION
 # ============================================================================
 
-def send_streak_to_user(driver: webdriver.Chrome, username: str) -> bool:
+# Screenshots taken this run, keyed by failure type
+FAIL_SHOT_COUNTS = Counter()
+_fail_shot_lock = threading.Lock()
+
+
+def save_failure_screenshot(driver: webdriver.Chrome, tag: str, username: str):
+    """Save a debug screenshot for only the first few failures of each type"""
+    # Workers fail concurrently; claim the slot atomically
+    with _fail_shot_lock:
+        if FAIL_SHOT_COUNTS[tag] >= MAX_FAIL_SHOTS:
+            return
+        FAIL_SHOT_COUNTS[tag] += 1
+    
+    driver.save_screenshot(f"debug_{tag}_{username}.png")
+
+
+def preload_profile(driver: webdriver.Chrome, username: str, main_handle: str) -> str:
+    """Start loading a profile in a background tab and return the tab's handle"""
+    handle = None
+    try:
+        # Open the tab blank so it is configured before the profile starts loading
+        driver.switch_to.new_window('tab')
+        handle = driver.current_window_handle
+        configure_tab(driver)
+        
+        # Navigate without blocking so the page keeps loading after we switch away
+        driver.execute_script("window.location.href = arguments[0];", f"https://www.tiktok.com/@{username}")
+        return handle
+    except Exception as e:
+        logger.warning(f"⚠️ Could not preload @{username}: {e}")
+        if handle:
+            close_tab(driver, handle)
+        return None
+    finally:
+        try:
+            driver.switch_to.window(main_handle)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not return to main tab: {e}")
+
+
+def close_tab(driver: webdriver.Chrome, handle: str):
+    try:
+        driver.switch_to.window(handle)
+        driver.close()
+    except Exception as e:
+        logger.debug(f"  Closing tab failed: {type(e).__name__}")
+
+
+def input_cleared(element):
+    """Wait condition: the given input is empty or has been removed from the page"""
+    def condition(driver):
+        try:
+            return not element.text.strip()
+        except StaleElementReferenceException:
+            return True
+    return condition
+
+
+def send_streak_to_user(driver: webdriver.Chrome, wait: WebDriverWait, username: str,
+                        preloaded: bool = False, force_reload: bool = False) -> bool:
     try:
         username = username.lstrip('@')
         logger.info(f"{'='*60}")
@@ -323,54 +524,45 @@ def send_streak_to_user(driver: webdriver.Chrome, username: str) -> bool:
         logger.info(f"{'='*60}")
         
         # Navigate to profile
-        profile_url = f"https://www.tiktok.com/@{username}"
-        logger.info(f"Navigating to {profile_url}")
-        driver.get(profile_url)
-        time.sleep(5)
+        if preloaded:
+            wait_for_profile_header(wait)
+        else:
+            open_profile(driver, wait, username, force_reload=force_reload)
         
         # Check captcha
-        for _ in range(CAPTCHA_CHECK_ATTEMPTS):
-            if check_and_close_captcha(driver):
-                time.sleep(2)
-            else:
-                break
-        
-        wait = WebDriverWait(driver, WAIT_TIMEOUT)
+        check_and_close_captcha(driver)
         
         # Find and click Message button
         message_button = find_message_button(driver, wait)
         if not message_button:
-            driver.save_screenshot(f"debug_no_button_{username}.png")
+            save_failure_screenshot(driver, "no_button", username)
             return False
         
         if not click_message_button(driver, message_button):
-            driver.save_screenshot(f"debug_click_failed_{username}.png")
+            save_failure_screenshot(driver, "click_failed", username)
             return False
         
-        # Check captcha after click
-        check_and_close_captcha(driver)
-        
-        # Find message input
+        # Wait for the message input to become usable
         logger.info("Searching for message input...")
         input_selectors = [
-            "//div[@contenteditable='true']",
-            "//div[@data-e2e='dm-input']",
-            "//div[@role='textbox']",
+            "div[contenteditable='true']",
+            "div[data-e2e='dm-input']",
+            "div[role='textbox']",
         ]
         
         message_input = None
-        for selector in input_selectors:
-            try:
-                message_input = wait.until(EC.presence_of_element_located((By.XPATH, selector)))
-                if message_input and message_input.is_displayed():
-                    logger.info(f"✓ Found message input")
-                    break
-            except:
-                continue
+        try:
+            message_input = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, ", ".join(input_selectors))))
+            logger.info("✓ Found message input")
+        except TimeoutException:
+            pass
+        
+        # Check captcha after click
+        check_and_close_captcha(driver)
         
         if not message_input:
             logger.error("❌ Message input not found")
-            driver.save_screenshot(f"debug_no_input_{username}.png")
+            save_failure_screenshot(driver, "no_input", username)
             return False
         
         # Type and send
@@ -383,8 +575,16 @@ def send_streak_to_user(driver: webdriver.Chrome, username: str) -> bool:
         time.sleep(1)
         
         message_input.send_keys(Keys.RETURN)
-        logger.info("✓ Message sent")
-        time.sleep(2)
+        
+        # The input we typed into clears (or is re-rendered) once TikTok accepts the
+        # message; wait for that since the tab may be closed right after we return.
+        # Enter has already been pressed, so a missed signal must never cause a resend.
+        try:
+            wait.until(input_cleared(message_input))
+            logger.info("✓ Message sent")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not confirm delivery ({type(e).__name__}), counting as sent")
+            save_failure_screenshot(driver, "unconfirmed", username)
         
         logger.info(f"✅ Success @{username}")
         return True
@@ -392,7 +592,7 @@ def send_streak_to_user(driver: webdriver.Chrome, username: str) -> bool:
     except Exception as e:
         logger.error(f"❌ Error @{username}: {e}")
         try:
-            driver.save_screenshot(f"debug_error_{username}.png")
+            save_failure_screenshot(driver, "error", username)
         except:
             pass
         return False
@@ -402,14 +602,223 @@ def send_streak_to_user(driver: webdriver.Chrome, username: str) -> bool:
 # MAIN BOT FUNCTION
 # ============================================================================
 
+def process_user(driver: webdriver.Chrome, wait: WebDriverWait, username: str, preloaded: bool = False) -> bool:
+    """Send the streak to one user, retrying up to MAX_RETRIES times"""
+    for attempt in range(MAX_RETRIES):
+        # Only the first attempt can rely on the preloaded page; retries reload it
+        if send_streak_to_user(driver, wait, username,
+                               preloaded=preloaded and attempt == 0, force_reload=attempt > 0):
+            log_activity(f"✓ @{username} - SUCCESS")
+            return True
+        
+        if attempt < MAX_RETRIES - 1:
+            log_activity(f"⚠️ @{username} - Retry {attempt+1}/{MAX_RETRIES}", "WARNING")
+            time.sleep(5)
+    
+    log_activity(f"✗ @{username} - FAILED", "ERROR")
+    return False
+
+
+# Browsers kept alive across daily runs, keyed by worker index
+_driver_pool: Dict[int, webdriver.Chrome] = {}
+
+
+def start_worker_driver(cookies: List[Dict], index: int) -> webdriver.Chrome:
+    """Launch one Chrome instance, injecting cookies only if its profile has no session"""
+    driver = setup_driver(str(Path(PROFILE_DIR) / f"worker_{index}"))
+    try:
+        if has_session(driver, cookies):
+            logger.info(f"✓ Worker {index} reusing saved session")
+        else:
+            # No warm-up navigation: the first profile load is already authenticated
+            load_cookies_to_driver(driver, cookies)
+    except Exception:
+        driver.quit()
+        raise
+    return driver
+
+
+async def get_driver_pool(worker_count: int, cookies: List[Dict]) -> List[webdriver.Chrome]:
+    """Return up to worker_count authenticated drivers, reusing those from previous runs"""
+    loop = asyncio.get_running_loop()
+    
+    # Drop browsers that died since the last run
+    for index, driver in list(_driver_pool.items()):
+        if not is_driver_alive(driver):
+            logger.warning(f"⚠️ Worker {index} browser is gone, restarting it")
+            del _driver_pool[index]
+            try:
+                driver.quit()
+            except:
+                pass
+        elif not has_session(driver, cookies):
+            logger.info(f"Worker {index} session differs from {COOKIES_FILE}, reloading cookies")
+            load_cookies_to_driver(driver, cookies)
+    
+    missing = [i for i in range(worker_count) if i not in _driver_pool]
+    started = await asyncio.gather(
+        *(loop.run_in_executor(None, start_worker_driver, cookies, i) for i in missing),
+        return_exceptions=True
+    )
+    
+    # Carry on with whichever workers started; only give up if none did
+    errors = []
+    for index, driver in zip(missing, started):
+        if isinstance(driver, BaseException):
+            logger.error(f"❌ Worker {index} browser failed to start: {driver}")
+            errors.append(driver)
+        else:
+            _driver_pool[index] = driver
+    
+    drivers = [_driver_pool[i] for i in range(worker_count) if i in _driver_pool]
+    if not drivers:
+        raise errors[0]
+    
+    return drivers
+
+
+def shutdown_drivers():
+    """Quit every pooled browser"""
+    for index, driver in list(_driver_pool.items()):
+        try:
+            driver.quit()
+            log_activity("Browser closed")
+        except:
+            pass
+        del _driver_pool[index]
+
+
+def process_user_in_tab(driver: webdriver.Chrome, wait: WebDriverWait, username: str, handle: str, main_handle: str) -> bool:
+    """Process a user in their preloaded tab, then close it"""
+    if not handle:
+        return process_user(driver, wait, username)
+    
+    try:
+        driver.switch_to.window(handle)
+    except Exception as e:
+        log_activity(f"✗ @{username} - FAILED (tab unavailable: {type(e).__name__})", "ERROR")
+        return False
+    
+    try:
+        return process_user(driver, wait, username, preloaded=True)
+    finally:
+        close_tab(driver, handle)
+        try:
+            driver.switch_to.window(main_handle)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not return to main tab: {e}")
+
+
+def close_tabs(driver: webdriver.Chrome, handles: List[str], main_handle: str):
+    """Close preloaded tabs that were never processed"""
+    for handle in handles:
+        if handle:
+            close_tab(driver, handle)
+    try:
+        driver.switch_to.window(main_handle)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not return to main tab: {e}")
+
+
+async def run_guarded(func, *args) -> bool:
+    """Run a blocking per-user call off the event loop; any crash counts as a failure"""
+    try:
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+    except Exception as e:
+        log_activity(f"Worker error: {e}", "ERROR")
+        return False
+
+
+async def pause_between_users():
+    delay = random.uniform(8, 15)
+    logger.info(f"Waiting {delay:.1f}s before next user...")
+    await asyncio.sleep(delay)
+
+
+async def streak_worker(queue: asyncio.Queue, driver: webdriver.Chrome, results: Dict[str, bool]):
+    """Pull usernames off the queue and process them on this worker's driver"""
+    loop = asyncio.get_running_loop()
+    
+    # One wait shared by every user this worker handles
+    wait = WebDriverWait(
+        driver, WAIT_TIMEOUT,
+        poll_frequency=POLL_FREQUENCY,
+        ignored_exceptions=(StaleElementReferenceException, NoSuchElementException)
+    )
+    
+    if TABS_PER_WORKER <= 1:
+        while True:
+            try:
+                username = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            
+            results[username] = await run_guarded(process_user, driver, wait, username)
+            
+            if not queue.empty():
+                await pause_between_users()
+    
+    # Keep the next profiles loading in background tabs while the current one is handled
+    main_handle = await loop.run_in_executor(None, lambda: driver.current_window_handle)
+    tabs = deque()
+    
+    try:
+        while True:
+            while len(tabs) < TABS_PER_WORKER and not queue.empty():
+                username = queue.get_nowait()
+                handle = await loop.run_in_executor(None, preload_profile, driver, username, main_handle)
+                tabs.append((username, handle))
+            
+            if not tabs:
+                return
+            
+            username, handle = tabs.popleft()
+            results[username] = await run_guarded(process_user_in_tab, driver, wait, username, handle, main_handle)
+            
+            if tabs or not queue.empty():
+                await pause_between_users()
+    finally:
+        # Don't leave preloaded tabs behind in the pooled browser
+        if tabs:
+            for username, _ in tabs:
+                results.setdefault(username, False)
+            await loop.run_in_executor(None, close_tabs, driver, [handle for _, handle in tabs], main_handle)
+
+
+async def run_workers(users: List[str], cookies: List[Dict]) -> Dict[str, bool]:
+    """Process users concurrently, one Chrome instance per worker"""
+    worker_count = max(1, min(CONCURRENT_WORKERS, len(users)))
+    drivers = await get_driver_pool(worker_count, cookies)
+    
+    queue = asyncio.Queue()
+    for username in users:
+        queue.put_nowait(username)
+    
+    log_activity(f"✓ Bot ready. Processing {len(users)} users with {len(drivers)} workers...")
+    
+    results = {}
+    outcomes = await asyncio.gather(
+        *(streak_worker(queue, driver, results) for driver in drivers),
+        return_exceptions=True
+    )
+    
+    # A crashed worker must not take the other workers' results with it
+    for outcome in outcomes:
+        if isinstance(outcome, Exception):
+            log_activity(f"Worker crashed: {outcome}", "ERROR")
+    
+    return results
+
+
 def run_streak_bot():
     """Main bot execution function"""
+    FAIL_SHOT_COUNTS.clear()
+    _spa_nav_disabled.clear()
+    
     log_activity("="*70)
     log_activity(f"DAILY RUN STARTED - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     log_activity("="*70)
     
-    driver = None
-    
     try:
         # Load config
         cookies = load_cookies()
@@ -419,38 +828,11 @@ def run_streak_bot():
             log_activity("No users in list.txt", "ERROR")
             return
         
-        # Setup browser
-        driver = setup_driver()
-        load_cookies_to_driver(driver, cookies)
-        
-        driver.get("https://www.tiktok.com")
-        time.sleep(3)
+        # Process users across concurrent browsers
+        results = asyncio.run(run_workers(users, cookies))
         
-        log_activity(f"✓ Bot ready. Processing {len(users)} users...")
-        
-        # Process each user
-        success_count = 0
-        fail_count = 0
-        
-        for username in users:
-            for attempt in range(MAX_RETRIES):
-                if send_streak_to_user(driver, username):
-                    success_count += 1
-                    log_activity(f"✓ @{username} - SUCCESS")
-                    break
-                else:
-                    if attempt < MAX_RETRIES - 1:
-                        log_activity(f"⚠️ @{username} - Retry {attempt+1}/{MAX_RETRIES}", "WARNING")
-                        time.sleep(5)
-                    else:
-                        fail_count += 1
-                        log_activity(f"✗ @{username} - FAILED", "ERROR")
-            
-            # Delay between users
-            if username != users[-1]:
-                delay = random.uniform(8, 15)
-                logger.info(f"Waiting {delay:.1f}s before next user...")
-                time.sleep(delay)
+        success_count = sum(1 for ok in results.values() if ok)
+        fail_count = len(users) - success_count
         
         # Summary
         log_activity("="*70)
@@ -463,20 +845,38 @@ def run_streak_bot():
         log_activity(f"Critical error: {e}", "ERROR")
         import traceback
         log_activity(traceback.format_exc(), "ERROR")
-        
-    finally:
-        if driver:
-            try:
-                driver.quit()
-                log_activity("Browser closed")
-            except:
-                pass
 
 
 # ============================================================================
 # DAILY SCHEDULER
 # ============================================================================
 
+def next_run_time(target_time: dt_time) -> datetime:
+    """Next datetime at which target_time occurs"""
+    now = datetime.now()
+    next_run = datetime.combine(now.date(), target_time)
+    
+    if now.time() >= target_time:
+        next_run += timedelta(days=1)
+    
+    return next_run
+
+
+def scheduler_heartbeat(target_time: dt_time, stop: threading.Event):
+    """Print a status update every HEARTBEAT_INTERVAL seconds until stopped"""
+    while not stop.wait(HEARTBEAT_INTERVAL):
+        now = datetime.now()
+        next_run = next_run_time(target_time)
+        
+        time_until = next_run - now
+        hours = int(time_until.total_seconds() / 3600)
+        minutes = int((time_until.total_seconds() % 3600) / 60)
+        
+        status = f"[{now.strftime('%H:%M:%S')}] ✓ Scheduler active. Next run in {hours}h {minutes}m ({next_run.strftime('%Y-%m-%d %H:%M')})"
+        print(status)
+        log_activity(f"Scheduler heartbeat. Next run: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+
+
 def start_daily_scheduler():
     """Start the daily scheduler loop"""
     
@@ -488,9 +888,6 @@ def start_daily_scheduler():
         logger.error(f"Invalid SEND_TIME format: {SEND_TIME}. Use HH:MM (24-hour)")
         return
     
-    # Schedule the job
-    schedule.every().day.at(SEND_TIME).do(run_streak_bot)
-    
     print()
     print("="*70)
     print("🤖 TikTok Streak Bot - Daily Scheduler Active")
@@ -505,13 +902,7 @@ def start_daily_scheduler():
     
     # Calculate next run
     now = datetime.now()
-    today_run = datetime.combine(now.date(), target_time)
-    
-    if now.time() < target_time:
-        next_run = today_run
-    else:
-        from datetime import timedelta
-        next_run = today_run + timedelta(days=1)
+    next_run = next_run_time(target_time)
     
     time_until = next_run - now
     hours_until = int(time_until.total_seconds() / 3600)
@@ -531,50 +922,41 @@ def start_daily_scheduler():
     
     log_activity(f"Scheduler started. Next run at {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Main loop
-    last_check = datetime.now()
+    # Status updates run on their own thread so the main loop only wakes to run the bot
+    stop_heartbeat = threading.Event()
+    threading.Thread(target=scheduler_heartbeat, args=(target_time, stop_heartbeat), daemon=True).start()
     
-    while True:
-        try:
-            # Run pending jobs
-            schedule.run_pending()
-            
-            # Status update every 15 minutes
-            now = datetime.now()
-            if (now - last_check).total_seconds() >= 900:  # 15 minutes
-                # Recalculate next run
-                if now.time() < target_time:
-                    next_run = datetime.combine(now.date(), target_time)
-                else:
-                    from datetime import timedelta
-                    next_run = datetime.combine(now.date(), target_time) + timedelta(days=1)
-                
-                time_until = next_run - now
-                hours = int(time_until.total_seconds() / 3600)
-                minutes = int((time_until.total_seconds() % 3600) / 60)
+    # Main loop: sleep until the next run
+    try:
+        while True:
+            try:
+                # Sleep in bounded chunks and re-check the wall clock, so DST/NTP
+                # changes or a system suspend can't push the run hours late
+                delay = (next_run - datetime.now()).total_seconds()
+                if delay > 0:
+                    time.sleep(min(delay, HEARTBEAT_INTERVAL))
+                    continue
                 
-                status = f"[{now.strftime('%H:%M:%S')}] ✓ Scheduler active. Next run in {hours}h {minutes}m ({next_run.strftime('%Y-%m-%d %H:%M')})"
-                print(status)
-                log_activity(f"Scheduler heartbeat. Next run: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+                # Move next_run forward first so an error can't re-trigger today's run
+                next_run = next_run_time(target_time)
+                run_streak_bot()
+                log_activity(f"Next run at {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
                 
-                last_check = now
-            
-            # Sleep for 1 minute
-            time.sleep(60)
-            
-        except KeyboardInterrupt:
-            print()
-            print("="*70)
-            print("⚠️  Scheduler stopped by user (Ctrl+C)")
-            print("="*70)
-            log_activity("Scheduler stopped by user")
-            break
-        except Exception as e:
-            error_msg = f"Scheduler error: {e}"
-            print(f"❌ {error_msg}")
-            log_activity(error_msg, "ERROR")
-            print("⏳ Retrying in 60 seconds...")
-            time.sleep(60)
+            except KeyboardInterrupt:
+                print()
+                print("="*70)
+                print("⚠️  Scheduler stopped by user (Ctrl+C)")
+                print("="*70)
+                log_activity("Scheduler stopped by user")
+                break
+            except Exception as e:
+                error_msg = f"Scheduler error: {e}"
+                print(f"❌ {error_msg}")
+                log_activity(error_msg, "ERROR")
+                print("⏳ Retrying in 60 seconds...")
+                time.sleep(60)
+    finally:
+        stop_heartbeat.set()
 
 
 # ============================================================================
@@ -595,4 +977,6 @@ if __name__ == "__main__":
         print("\n✓ Bot stopped gracefully")
     except Exception as e:
         print(f"\n✗ Fatal error: {e}")
-        log_activity(f"Fatal error: {e}", "ERROR")
\ No newline at end of file
+        log_activity(f"Fatal error: {e}", "ERROR")
+    finally:
+        shutdown_drivers()
\ No newline at end of file